@@ -32,6 +32,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Reject oversized uploads early
+    "tweets.middleware.file_size.file_size_middleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -68,6 +70,9 @@ DATABASES = {
         "PASSWORD": os.environ.get("DB_PASSWORD", "admin"),
         "HOST": os.environ.get("DB_HOST", "postgres"),
         "PORT": os.environ.get("DB_PORT", "5432"),
+        # Keep connections open between requests and verify them before reuse
+        "CONN_MAX_AGE": 60,
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
@@ -104,8 +109,17 @@ MEDIA_ROOT = "/app/media"
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Keep every flash message (post/update success, form errors) in a signed cookie
+# instead of the session table
+MESSAGE_STORAGE = "django.contrib.messages.storage.cookie.CookieStorage"
+
 # File upload settings
-FILE_UPLOAD_MAX_MEMORY_SIZE = 5 * 1024 * 1024  # 5MB
+# Largest accepted upload; enforced by the size middleware, TweetForm and Tweet.clean
+MAX_UPLOAD_SIZE = 5 * 1024 * 1024  # 5MB
+# Stream every upload to a temporary file instead of buffering it in memory
+FILE_UPLOAD_HANDLERS = ["django.core.files.uploadhandler.TemporaryFileUploadHandler"]
+FILE_UPLOAD_MAX_MEMORY_SIZE = 0
+# Excludes file data, so oversized images are still rejected by Content-Length
 DATA_UPLOAD_MAX_MEMORY_SIZE = 5 * 1024 * 1024  # 5MB
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 1000
 
@@ -5,7 +5,6 @@ Script to clean up test files created during Django tests
 
 import os
 import shutil
-import glob
 
 
 def cleanup_test_files():
@@ -22,10 +21,15 @@ def cleanup_test_files():
             except Exception as e:
                 print(f"⚠️  Could not clean {path}: {e}")
 
-    # Clean up test image files in current directory
-    test_files = (
-        glob.glob("test_*.jpg") + glob.glob("test_*.png") + glob.glob("test_*.gif")
-    )
+    # Clean up test image files in current directory (single directory pass)
+    with os.scandir(".") as entries:
+        test_files = [
+            entry.path
+            for entry in entries
+            if entry.name.startswith("test_")
+            and entry.name.endswith((".jpg", ".png", ".gif"))
+            and entry.is_file()
+        ]
     for file in test_files:
         try:
             os.remove(file)
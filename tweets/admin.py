@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import BooleanField, Case, Value, When
 from .models import Tweet
 
 
@@ -9,8 +10,24 @@ class TweetAdmin(admin.ModelAdmin):
     search_fields = ("text", "user__username")
     readonly_fields = ("created_at", "updated_at")
 
+    def get_queryset(self, request):
+        # Compute has_image in the database so the list page can sort by it
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                _has_image=Case(
+                    When(image__isnull=True, then=Value(False)),
+                    When(image="", then=Value(False)),
+                    default=Value(True),
+                    output_field=BooleanField(),
+                )
+            )
+        )
+
     def has_image(self, obj):
-        return bool(obj.image)
+        return obj._has_image
 
     has_image.boolean = True
     has_image.short_description = "Has Image"
+    has_image.admin_order_field = "_has_image"
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TweetsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tweets'
+
+    def ready(self):
+        # Connect the feed cache invalidation signals
+        from . import feed_cache  # noqa: F401
@@ -0,0 +1,27 @@
+"""
+Versioning for the cached tweet feed fragment.
+Every tweet write bumps the version so the next feed render misses the cache.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Tweet
+
+FEED_CACHE_TIMEOUT = 60  # seconds
+_FEED_VERSION_KEY = "tweets:feed_version"
+
+
+def feed_cache_version():
+    """Current feed version, part of the feed fragment's cache key"""
+    return cache.get_or_set(_FEED_VERSION_KEY, 0, timeout=None)
+
+
+@receiver([post_save, post_delete], sender=Tweet)
+def bump_feed_cache_version(sender, **kwargs):
+    """Invalidate cached feed pages whenever a tweet changes"""
+    try:
+        cache.incr(_FEED_VERSION_KEY)
+    except ValueError:
+        # The key was never set or has been evicted
+        cache.set(_FEED_VERSION_KEY, 1, timeout=None)
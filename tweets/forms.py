@@ -1,63 +1,59 @@
 from django import forms
+from django.conf import settings
 from .models import Tweet
 
+_ALLOWED_IMAGE_TYPES = frozenset(("image/jpeg", "image/png", "image/gif", "image/webp"))
 
-class TweetForm(forms.ModelForm):
-    """Form for creating and editing tweets"""
 
-    text = forms.CharField(
-        label="Tweet Text",
-        max_length=280,
-        widget=forms.Textarea(
-            attrs={
-                "class": "form-control",
-                "rows": 3,
-                "placeholder": "What's happening? (max 280 characters)",
-                "maxlength": 280,
-            }
-        ),
-    )
+def _validate_image(image):
+    """Validate size and type of an uploaded tweet image"""
+    if image:
+        # Check file size
+        if image.size > settings.MAX_UPLOAD_SIZE:
+            raise forms.ValidationError(
+                "Image file size must be under "
+                f"{settings.MAX_UPLOAD_SIZE // (1024 * 1024)}MB"
+            )
+
+        # Check file type
+        if image.content_type not in _ALLOWED_IMAGE_TYPES:
+            raise forms.ValidationError(
+                "Only JPEG, PNG, GIF and WebP images are allowed"
+            )
+
+    return image
 
-    image = forms.ImageField(
-        label="Image (optional)",
-        required=False,
-        widget=forms.FileInput(attrs={"class": "form-control", "accept": "image/*"}),
-    )
+
+_TWEET_TEXTAREA = forms.Textarea(
+    attrs={
+        "class": "form-control",
+        "rows": 3,
+        "placeholder": "What's happening? (max 280 characters)",
+        "maxlength": 280,
+    }
+)
+_REPLY_TEXTAREA = forms.Textarea(
+    attrs={
+        "class": "form-control",
+        "rows": 2,
+        "placeholder": "Reply to this tweet...",
+        "maxlength": 280,
+    }
+)
+_IMAGE_INPUT = forms.FileInput(attrs={"class": "form-control", "accept": "image/*"})
+
+
+class TweetForm(forms.ModelForm):
+    """Form for creating and editing tweets"""
 
     class Meta:
         model = Tweet
         fields = ["text", "image"]
-        widgets = {
-            "text": forms.Textarea(
-                attrs={
-                    "class": "form-control",
-                    "rows": 3,
-                    "placeholder": "What's happening? (max 280 characters)",
-                    "maxlength": 280,
-                }
-            ),
-            "image": forms.FileInput(
-                attrs={"class": "form-control", "accept": "image/*"}
-            ),
-        }
+        labels = {"text": "Tweet Text", "image": "Image (optional)"}
+        widgets = {"text": _TWEET_TEXTAREA, "image": _IMAGE_INPUT}
 
     def clean_image(self):
-        image = self.cleaned_data.get("image")
-        if image:
-            # Check file size (5MB limit)
-            if image.size > 5 * 1024 * 1024:
-                raise forms.ValidationError(
-                    "Image file size must be under 5MB"
-                )
-
-            # Check file type
-            allowed_types = ["image/jpeg", "image/png", "image/gif", "image/webp"]
-            if image.content_type not in allowed_types:
-                raise forms.ValidationError(
-                    "Only JPEG, PNG, GIF and WebP images are allowed"
-                )
-
-        return image
+        return _validate_image(self.cleaned_data.get("image"))
 
 
 class ReplyForm(forms.ModelForm):
@@ -66,34 +62,7 @@ class ReplyForm(forms.ModelForm):
     class Meta:
         model = Tweet
         fields = ["text", "image"]
-        widgets = {
-            "text": forms.Textarea(
-                attrs={
-                    "class": "form-control",
-                    "rows": 2,
-                    "placeholder": "Reply to this tweet...",
-                    "maxlength": 280,
-                }
-            ),
-            "image": forms.FileInput(
-                attrs={"class": "form-control", "accept": "image/*"}
-            ),
-        }
+        widgets = {"text": _REPLY_TEXTAREA, "image": _IMAGE_INPUT}
 
     def clean_image(self):
-        image = self.cleaned_data.get("image")
-        if image:
-            # Check file size (5MB limit)
-            if image.size > 5 * 1024 * 1024:
-                raise forms.ValidationError(
-                    "Image file size must be under 5MB"
-                )
-
-            # Check file type
-            allowed_types = ["image/jpeg", "image/png", "image/gif", "image/webp"]
-            if image.content_type not in allowed_types:
-                raise forms.ValidationError(
-                    "Only JPEG, PNG, GIF and WebP images are allowed"
-                )
-
-        return image
+        return _validate_image(self.cleaned_data.get("image"))
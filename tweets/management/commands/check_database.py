@@ -27,7 +27,7 @@ class Command(BaseCommand):
             "--retry-delay",
             type=int,
             default=2,
-            help="Delay between retries in seconds (default: 2)",
+            help="Maximum delay between retries in seconds (default: 2)",
         )
         parser.add_argument(
             "--create-tables",
@@ -42,7 +42,9 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.SUCCESS("🔍 Checking database connectivity..."))
 
-        # Try to connect to database with retries
+        # Try to connect to database with retries, backing off exponentially
+        # from a short initial delay up to retry_delay
+        delay = min(0.05, retry_delay)
         for attempt in range(max_retries):
             try:
                 # Test basic connection
@@ -65,9 +67,13 @@ class Command(BaseCommand):
                         )
                     )
                     self.stdout.write(
-                        f"🔄 Retrying in {retry_delay} seconds... ({max_retries - attempt - 1} attempts left)"
+                        f"🔄 Retrying in {delay:.2f} seconds... ({max_retries - attempt - 1} attempts left)"
                     )
-                    time.sleep(retry_delay)
+                    # Drop the connection only if it is broken; a healthy
+                    # one is kept for the next attempt and the checks below
+                    connection.close_if_unusable_or_obsolete()
+                    time.sleep(delay)
+                    delay = min(delay * 1.7, retry_delay)
                 else:
                     self.stdout.write(
                         self.style.ERROR(
@@ -101,24 +107,41 @@ class Command(BaseCommand):
             "tweets_tweet",  # Your app's main table
         ]
 
-        missing_tables = []
-
         with connection.cursor() as cursor:
+            # Count first so the happy path doesn't transfer any table names
             cursor.execute(
                 """
-                SELECT table_name 
-                FROM information_schema.tables 
+                SELECT COUNT(*)
+                FROM information_schema.tables
                 WHERE table_schema = 'public'
-            """
+                AND table_name = ANY(%s)
+            """,
+                [required_tables],
             )
-            existing_tables = {row[0] for row in cursor.fetchall()}
+            all_present = cursor.fetchone()[0] == len(required_tables)
+
+            missing_tables = []
+            if not all_present:
+                cursor.execute(
+                    """
+                    SELECT table_name
+                    FROM information_schema.tables
+                    WHERE table_schema = 'public'
+                    AND table_name = ANY(%s)
+                """,
+                    [required_tables],
+                )
+                existing_tables = {row[0] for row in cursor.fetchall()}
+                missing_tables = [
+                    table for table in required_tables if table not in existing_tables
+                ]
 
-        for table in required_tables:
-            if table in existing_tables:
-                self.stdout.write(f"  ✅ {table}")
-            else:
-                self.stdout.write(f"  ❌ {table} (missing)")
-                missing_tables.append(table)
+        if missing_tables:
+            self.stdout.write(
+                "\n".join(f"  ❌ {table} (missing)" for table in missing_tables)
+            )
+        else:
+            self.stdout.write(f"  ✅ All {len(required_tables)} required tables exist")
 
         if missing_tables:
             if create_tables:
@@ -142,41 +165,42 @@ class Command(BaseCommand):
         self.stdout.write("ℹ️  Checking database information...")
 
         with connection.cursor() as cursor:
-            # Check PostgreSQL version
-            cursor.execute("SELECT version()")
-            version = cursor.fetchone()[0]
-            self.stdout.write(f"  📊 PostgreSQL: {version.split()[1]}")
-
-            # Check available extensions
+            # Fetch version, database size and extensions in one round-trip
             cursor.execute(
                 """
-                SELECT extname, extversion 
-                FROM pg_extension 
-                WHERE extname IN ('uuid-ossp', 'pg_trgm', 'btree_gin')
-            """
+                SELECT
+                    version(),
+                    pg_size_pretty(pg_database_size(current_database())),
+                    COALESCE(
+                        (
+                            SELECT json_agg(json_build_array(extname, extversion))
+                            FROM pg_extension
+                            WHERE extname = ANY(%s)
+                        ),
+                        '[]'::json
+                    )
+            """,
+                [["uuid-ossp", "pg_trgm", "btree_gin"]],
             )
-            extensions = cursor.fetchall()
+            version, db_size, extensions = cursor.fetchone()
+
+            lines = [f"  📊 PostgreSQL: {version.split()[1]}"]
 
             if extensions:
-                self.stdout.write("  🔌 Extensions:")
-                for ext_name, ext_version in extensions:
-                    self.stdout.write(f"    - {ext_name} v{ext_version}")
+                lines.append("  🔌 Extensions:")
+                lines.extend(
+                    f"    - {ext_name} v{ext_version}"
+                    for ext_name, ext_version in extensions
+                )
             else:
-                self.stdout.write("  🔌 No custom extensions found")
+                lines.append("  🔌 No custom extensions found")
 
-            # Check database size
-            cursor.execute(
-                """
-                SELECT pg_size_pretty(pg_database_size(current_database()))
-            """
-            )
-            db_size = cursor.fetchone()[0]
-            self.stdout.write(f"  💾 Database size: {db_size}")
+            lines.append(f"  💾 Database size: {db_size}")
 
             # Check connection info
             db_name = connection.settings_dict.get("NAME", "Unknown")
             db_host = connection.settings_dict.get("HOST", "Unknown")
             db_port = connection.settings_dict.get("PORT", "Unknown")
-            self.stdout.write(f"  🗄️  Connected to: {db_name} on {db_host}:{db_port}")
-
+            lines.append(f"  🗄️  Connected to: {db_name} on {db_host}:{db_port}")
 
+            self.stdout.write("\n".join(lines))
@@ -4,6 +4,7 @@ This middleware ensures the database is ready before processing requests.
 """
 
 import logging
+import threading
 from django.core.management import call_command
 from django.db import connection, DatabaseError
 from django.db.utils import OperationalError
@@ -13,12 +14,20 @@ from django.conf import settings
 logger = logging.getLogger(__name__)
 
 
+# Shared by every middleware instance in the process once the schema is known
+_MIGRATIONS_PRESENT = None
+_LOCK = threading.Lock()
+
+
 class DatabaseCheckMiddleware:
     """
     Middleware to check database connectivity on first request.
     This ensures the database is ready before processing any requests.
     """
 
+    # process_exception needs a class; slots keep per-request attribute access cheap
+    __slots__ = ("get_response", "_db_checked", "_db_healthy")
+
     def __init__(self, get_response):
         self.get_response = get_response
         self._db_checked = False
@@ -27,13 +36,17 @@ class DatabaseCheckMiddleware:
     def __call__(self, request):
         # Check database only once per server startup
         if not self._db_checked:
-            print("🔍 DatabaseCheckMiddleware: First request, checking database...")
+            if settings.DEBUG:
+                print("🔍 DatabaseCheckMiddleware: First request, checking database...")
             self._check_database()
             self._db_checked = True
 
         # If database is unhealthy, return error
         if not self._db_healthy:
-            print("❌ DatabaseCheckMiddleware: Database is unhealthy, returning error")
+            if settings.DEBUG:
+                print(
+                    "❌ DatabaseCheckMiddleware: Database is unhealthy, returning error"
+                )
             return HttpResponseServerError(
                 "Database is not available. Please check your database connection.",
                 content_type="text/plain",
@@ -43,24 +56,22 @@ class DatabaseCheckMiddleware:
 
     def _check_database(self):
         """Check database connectivity and health."""
+        global _MIGRATIONS_PRESENT
+        if _MIGRATIONS_PRESENT:
+            self._db_healthy = True
+            return
+
         logger.info("🔍 DatabaseCheckMiddleware: Starting database health check...")
         try:
             # Test basic connection
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-                cursor.fetchone()
+            connection.ensure_connection()
+            if not connection.is_usable():
+                raise OperationalError("Database connection is not usable")
 
             # Check if Django tables exist
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    """
-                    SELECT COUNT(*) 
-                    FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    AND table_name = 'django_migrations'
-                """
-                )
-                has_migrations_table = cursor.fetchone()[0] > 0
+            has_migrations_table = (
+                "django_migrations" in connection.introspection.table_names()
+            )
 
             if not has_migrations_table:
                 logger.warning(
@@ -69,30 +80,34 @@ class DatabaseCheckMiddleware:
                 call_command("migrate", verbosity=0)
                 logger.info("Migrations completed successfully")
 
+            with _LOCK:
+                _MIGRATIONS_PRESENT = True
             self._db_healthy = True
             logger.info("Database connectivity check passed")
 
         except (OperationalError, DatabaseError) as e:
             self._db_healthy = False
             logger.error(
-                f"❌ DatabaseCheckMiddleware: Database connectivity check failed: {e}"
+                "❌ DatabaseCheckMiddleware: Database connectivity check failed: %s", e
             )
 
             # Log detailed error information
             if hasattr(settings, "DATABASES"):
                 db_config = settings.DATABASES.get("default", {})
                 logger.error(
-                    f"Database config: {db_config.get('HOST', 'Unknown')}:{db_config.get('PORT', 'Unknown')}"
+                    "Database config: %s:%s",
+                    db_config.get("HOST", "Unknown"),
+                    db_config.get("PORT", "Unknown"),
                 )
 
         except Exception as e:
             self._db_healthy = False
-            logger.error(f"Unexpected error during database check: {e}")
+            logger.error("Unexpected error during database check: %s", e)
 
     def process_exception(self, request, exception):
         """Handle database-related exceptions."""
         if isinstance(exception, (OperationalError, DatabaseError)):
-            logger.error(f"Database error in request: {exception}")
+            logger.error("Database error in request: %s", exception)
             return HttpResponseServerError(
                 "Database error occurred. Please try again later.",
                 content_type="text/plain",
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-15 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tweets', '0002_alter_tweet_options_tweet_parent_tweet_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tweet',
+            index=models.Index(fields=['-created_at'], name='tweet_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tweet',
+            index=models.Index(fields=['user', '-created_at'], name='tweet_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tweet',
+            index=models.Index(fields=['parent_tweet', '-created_at'], name='tweet_parent_created_idx'),
+        ),
+    ]
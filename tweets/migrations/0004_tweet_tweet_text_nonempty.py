@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-15 10:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tweets', '0003_tweet_tweet_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='tweet',
+            constraint=models.CheckConstraint(condition=models.Q(('text', ''), _negated=True), name='tweet_text_nonempty'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-15 11:03
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tweets', '0004_tweet_tweet_text_nonempty'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tweet',
+            name='image',
+            field=models.FileField(blank=True, null=True, upload_to='tweets/', validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'gif', 'webp'])]),
+        ),
+    ]
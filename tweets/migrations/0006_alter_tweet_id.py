@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-15 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tweets', '0005_alter_tweet_image'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tweet',
+            name='id',
+            field=models.BigAutoField(primary_key=True, serialize=False),
+        ),
+    ]
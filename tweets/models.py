@@ -1,12 +1,31 @@
+from django.conf import settings
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.core.validators import FileExtensionValidator
+
+
+class TweetQuerySet(models.QuerySet):
+    def only_displayed(self, *fields):
+        """Load just the tweet and author fields the templates render"""
+        return self.select_related("user").only(
+            "text", "image", "created_at", "user__username", *fields
+        )
 
 
 class Tweet(models.Model):
     # Basic tweet fields
+    # Explicit so a DEFAULT_AUTO_FIELD change can't silently alter the key
+    id = models.BigAutoField(primary_key=True)
     text = models.CharField(max_length=280)
-    image = models.ImageField(upload_to="tweets/", blank=True, null=True)
+    image = models.FileField(
+        upload_to="tweets/",
+        blank=True,
+        null=True,
+        validators=[
+            FileExtensionValidator(["jpg", "jpeg", "png", "gif", "webp"])
+        ],
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -18,18 +37,30 @@ class Tweet(models.Model):
         "self", on_delete=models.CASCADE, null=True, blank=True, related_name="replies"
     )
 
+    objects = TweetQuerySet.as_manager()
+
     # Image validation and processing
     def clean(self):
-        if self.image and self.image.size > 5 * 1024 * 1024:  # 5MB limit
-            raise ValidationError("Image file size must be under 5MB")
-
-    def save(self, *args, **kwargs):
-        # Validate before saving
-        self.clean()
-        super().save(*args, **kwargs)
+        if self.image and self.image.size > settings.MAX_UPLOAD_SIZE:
+            raise ValidationError(
+                "Image file size must be under "
+                f"{settings.MAX_UPLOAD_SIZE // (1024 * 1024)}MB"
+            )
 
     def __str__(self):
         return f"{self.user.username}: {self.text[:50]}"
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"], name="tweet_created_idx"),
+            models.Index(fields=["user", "-created_at"], name="tweet_user_created_idx"),
+            models.Index(
+                fields=["parent_tweet", "-created_at"], name="tweet_parent_created_idx"
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=~models.Q(text=""), name="tweet_text_nonempty"
+            ),
+        ]
@@ -3,42 +3,79 @@ Pytest configuration and common fixtures for MiniTweet tests
 """
 
 import pytest
+from django.test import TestCase, TransactionTestCase
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from tweets.models import Tweet
+
+
+def pytest_collection_modifyitems(items):
+    """Keep integration tests on per-test rollback instead of table truncation"""
+    for item in items:
+        if item.get_closest_marker("integration") is None:
+            continue
+        marker = item.get_closest_marker("django_db")
+        cls = getattr(item, "cls", None)
+        if (marker and marker.kwargs.get("transaction")) or (
+            cls
+            and issubclass(cls, TransactionTestCase)
+            and not issubclass(cls, TestCase)
+        ):
+            raise pytest.UsageError(
+                f"{item.nodeid} uses a transactional test database; "
+                "integration tests must use the rollback-based django_db mark"
+            )
+
+
+@pytest.fixture(scope="session")
+def shared_users(django_db_setup, django_db_blocker):
+    """Create the test users once per session instead of once per test"""
+    with django_db_blocker.unblock():
+        # A hard-killed run skips the teardown below and leaves these rows in the
+        # reused test database, so clear them before creating the users again
+        User.objects.filter(username__in=("testuser", "testuser2")).delete()
+        users = {
+            "user": User.objects.create_user(
+                username="testuser", email="test@example.com", password="testpass123"
+            ),
+            "user2": User.objects.create_user(
+                username="testuser2", email="test2@example.com", password="testpass123"
+            ),
+        }
+
+    yield users
+
+    with django_db_blocker.unblock():
+        User.objects.filter(pk__in=[user.pk for user in users.values()]).delete()
 
 
 @pytest.fixture
-def test_user():
-    """Create a test user for testing"""
-    from django.contrib.auth.models import User
-
-    return User.objects.create_user(
-        username="testuser", email="test@example.com", password="testpass123"
-    )
+def without_csrf_middleware(settings):
+    """Drop CsrfViewMiddleware for client tests that don't exercise CSRF"""
+    settings.MIDDLEWARE = [m for m in settings.MIDDLEWARE if "csrf" not in m.lower()]
 
 
 @pytest.fixture
-def test_user2():
-    """Create a second test user for testing"""
-    from django.contrib.auth.models import User
+def test_user(shared_users, db):
+    """Return a fresh instance of the shared test user"""
+    return User.objects.get(pk=shared_users["user"].pk)
 
-    return User.objects.create_user(
-        username="testuser2", email="test2@example.com", password="testpass123"
-    )
+
+@pytest.fixture
+def test_user2(shared_users, db):
+    """Return a fresh instance of the second shared test user"""
+    return User.objects.get(pk=shared_users["user2"].pk)
 
 
 @pytest.fixture
 def sample_tweet(test_user):
     """Create a sample tweet for testing"""
-    from tweets.models import Tweet
-
     return Tweet.objects.create(text="This is a test tweet", user=test_user)
 
 
 @pytest.fixture
 def sample_tweet_with_image(test_user):
     """Create a sample tweet with image for testing"""
-    from django.core.files.uploadedfile import SimpleUploadedFile
-    from tweets.models import Tweet
-
     # Create a simple test image
     image_content = b"fake-image-content"
     image = SimpleUploadedFile(
@@ -53,8 +90,6 @@ def sample_tweet_with_image(test_user):
 @pytest.fixture
 def sample_reply(test_user, sample_tweet):
     """Create a sample reply tweet for testing"""
-    from tweets.models import Tweet
-
     return Tweet.objects.create(
         text="This is a test reply", user=test_user, parent_tweet=sample_tweet
     )
@@ -63,21 +98,16 @@ def sample_reply(test_user, sample_tweet):
 @pytest.fixture
 def large_image_file():
     """Create a large image file for testing file size validation"""
-    from django.core.files.uploadedfile import SimpleUploadedFile
-
-    # Create a file larger than 5MB
-    large_content = b"x" * (6 * 1024 * 1024)  # 6MB
-    return SimpleUploadedFile(
-        "large_image.jpg", large_content, content_type="image/jpeg"
-    )
+    # Size validation only reads .size, so report 6MB without allocating it
+    large_image = SimpleUploadedFile("large_image.jpg", b"", content_type="image/jpeg")
+    large_image.size = 6 * 1024 * 1024  # 6MB
+    return large_image
 
 
 @pytest.fixture
 def invalid_image_file():
     """Create an invalid image file for testing file type validation"""
-    from django.core.files.uploadedfile import SimpleUploadedFile
-
-    invalid_content = b"invalid-file-content"
+    invalid_content = b"x"
     return SimpleUploadedFile(
         "invalid_file.txt", invalid_content, content_type="text/plain"
     )
@@ -86,9 +116,7 @@ def invalid_image_file():
 @pytest.fixture
 def valid_image_file():
     """Create a valid image file for testing"""
-    from django.core.files.uploadedfile import SimpleUploadedFile
-
-    image_content = b"valid-image-content"
+    image_content = b"x"
     return SimpleUploadedFile(
         "valid_image.png", image_content, content_type="image/png"
     )
@@ -3,71 +3,54 @@ Integration tests for database operations and data integrity
 """
 
 import pytest
-from django.contrib.auth.models import User
 from django.db import transaction
 from tweets.models import Tweet
 
 
 @pytest.mark.django_db
 @pytest.mark.integration
-class DatabaseOperationsTest:
+class TestDatabaseOperations:
     """Test cases for database operations"""
 
-    def test_basic_tweet_creation(self):
+    def test_basic_tweet_creation(self, test_user):
         """Test basic tweet creation"""
-        user = User.objects.create_user(
-            username="testuser", email="test@example.com", password="testpass123"
-        )
-
-        tweet = Tweet.objects.create(text="Test tweet", user=user)
+        tweet = Tweet.objects.create(text="Test tweet", user=test_user)
 
         assert tweet.text == "Test tweet"
-        assert tweet.user == user
+        assert tweet.user == test_user
         assert tweet.id is not None
 
-    def test_tweet_with_reply(self):
+    def test_tweet_with_reply(self, test_user):
         """Test tweet with reply creation"""
-        user = User.objects.create_user(
-            username="testuser", email="test@example.com", password="testpass123"
-        )
-
-        parent_tweet = Tweet.objects.create(text="Parent tweet", user=user)
+        parent_tweet = Tweet.objects.create(text="Parent tweet", user=test_user)
         reply = Tweet.objects.create(
-            text="Reply to parent", user=user, parent_tweet=parent_tweet
+            text="Reply to parent", user=test_user, parent_tweet=parent_tweet
         )
 
         assert reply.parent_tweet == parent_tweet
         assert reply.text == "Reply to parent"
 
-    def test_tweet_ordering(self):
+    def test_tweet_ordering(self, test_user):
         """Test tweet ordering by creation time"""
-        user = User.objects.create_user(
-            username="testuser", email="test@example.com", password="testpass123"
-        )
-
-        tweet1 = Tweet.objects.create(text="First tweet", user=user)
-        tweet2 = Tweet.objects.create(text="Second tweet", user=user)
+        tweet1 = Tweet.objects.create(text="First tweet", user=test_user)
+        tweet2 = Tweet.objects.create(text="Second tweet", user=test_user)
 
         # Get tweets ordered by creation time (newest first)
         tweets = Tweet.objects.all().order_by("-created_at")
 
-        assert tweets[0] == tweet2
-        assert tweets[1] == tweet1
+        assert tweets[0].pk == tweet2.pk
+        assert tweets[1].pk == tweet1.pk
 
 
 @pytest.mark.django_db
 @pytest.mark.integration
-class DatabaseTransactionTest:
+class TestDatabaseTransaction:
     """Test cases for database transactions"""
 
-    def test_basic_transaction(self):
+    def test_basic_transaction(self, test_user):
         """Test basic transaction"""
-        user = User.objects.create_user(
-            username="testuser", email="test@example.com", password="testpass123"
-        )
-
         with transaction.atomic():
-            tweet = Tweet.objects.create(text="Transaction tweet", user=user)
+            tweet = Tweet.objects.create(text="Transaction tweet", user=test_user)
             assert tweet.id is not None
 
         # Tweet should exist after transaction
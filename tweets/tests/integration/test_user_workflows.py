@@ -1,39 +1,32 @@
 """
 Integration tests for complete user workflows
+
+Each test runs inside a transaction that is rolled back afterwards; none of
+them need transaction=True, which truncates every table instead.
 """
 
 import pytest
-from django.test import Client
-from django.contrib.auth.models import User
 from tweets.models import Tweet
 
 
 @pytest.mark.django_db
 @pytest.mark.integration
-class UserWorkflowTest:
+@pytest.mark.workflow
+@pytest.mark.usefixtures("without_csrf_middleware")
+class TestUserWorkflow:
     """Integration tests for user workflows"""
 
-    def test_basic_user_workflow(self):
+    def test_basic_user_workflow(self, client, test_user):
         """Test basic user workflow"""
-        user = User.objects.create_user(
-            username="testuser", email="test@example.com", password="testpass123"
-        )
-
-        client = Client()
-        client.force_login(user)
+        client.force_login(test_user)
 
         # Test user can access main page
         response = client.get("/")
         assert response.status_code == 200
 
-    def test_user_can_create_tweet(self):
+    def test_user_can_create_tweet(self, client, test_user):
         """Test user can create a tweet"""
-        user = User.objects.create_user(
-            username="testuser", email="test@example.com", password="testpass123"
-        )
-
-        client = Client()
-        client.force_login(user)
+        client.force_login(test_user)
 
         # Test creating a tweet
         response = client.post("/", {"text": "Test tweet from user"})
@@ -42,18 +35,48 @@ class UserWorkflowTest:
             302,
         ]  # Can be either redirect or success page
 
-    def test_user_can_view_tweets(self):
-        """Test user can view tweets"""
-        user = User.objects.create_user(
-            username="testuser", email="test@example.com", password="testpass123"
+    def test_user_can_view_tweets(
+        self, client, test_user, test_user2, django_assert_num_queries
+    ):
+        """Test user can view tweets without a query per tweet"""
+        # Enough tweets from alternating authors that a per-row query shows up
+        Tweet.objects.bulk_create(
+            [
+                Tweet(text=f"Test tweet {i}", user=(test_user, test_user2)[i % 2])
+                for i in range(10)
+            ]
         )
 
-        # Create a tweet
-        tweet = Tweet.objects.create(text="Test tweet", user=user)
+        client.force_login(test_user)
+        # Warm up so one-off first-request checks don't skew the count
+        client.get("/")
 
-        client = Client()
-        client.force_login(user)
+        # Session, user, paginator count and the page itself
+        with django_assert_num_queries(4):
+            response = client.get("/")
+        assert response.status_code == 200
 
-        # Test viewing tweets
-        response = client.get("/")
+    def test_user_can_view_conversation(
+        self, client, test_user, test_user2, django_assert_num_queries
+    ):
+        """Test tweet detail loads reply authors without a query per reply"""
+        tweet = Tweet.objects.create(text="Conversation start", user=test_user)
+        Tweet.objects.bulk_create(
+            [
+                Tweet(
+                    text=f"Reply {i}",
+                    user=(test_user, test_user2)[i % 2],
+                    parent_tweet=tweet,
+                )
+                for i in range(10)
+            ]
+        )
+
+        client.force_login(test_user)
+        # Warm up so one-off first-request checks don't skew the count
+        client.get(f"/{tweet.pk}/")
+
+        # The tweet with its author, then the replies with theirs
+        with django_assert_num_queries(2):
+            response = client.get(f"/{tweet.pk}/")
         assert response.status_code == 200
@@ -7,89 +7,146 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from tweets.forms import TweetForm, ReplyForm
 
 
+def _sized_upload(name, size):
+    """Build an upload that reports the given size without allocating it"""
+    upload = SimpleUploadedFile(name, b"x", content_type="image/jpeg")
+    upload.size = size
+    return upload
+
+
+_IMAGE_TYPE_CASES = [
+    ("image.jpg", "image/jpeg", True),
+    ("image.png", "image/png", True),
+    ("image.gif", "image/gif", True),
+    ("image.webp", "image/webp", True),
+    ("document.pdf", "application/pdf", False),
+    ("notes.txt", "text/plain", False),
+    # Valid extensions, so only the form's content-type check can reject these
+    ("image.jpg", "application/pdf", False),
+    ("image.png", "text/html", False),
+]
+
+_FORM_CLASSES = pytest.mark.parametrize(
+    "form_cls", [TweetForm, ReplyForm], ids=["tweet", "reply"]
+)
+
+
+@pytest.fixture(scope="session")
+def unbound_forms():
+    """Build one unbound instance per form for tests that only inspect them"""
+    return {TweetForm: TweetForm(), ReplyForm: ReplyForm()}
+
+
 @pytest.mark.django_db
 @pytest.mark.forms
 @pytest.mark.unit
-class TestTweetForm:
-    """Test cases for TweetForm"""
+@_FORM_CLASSES
+def test_form_valid_data(form_cls):
+    """Test form with valid data"""
+    form = form_cls(data={"text": "This is valid text"})
 
-    def test_tweet_form_valid_data(self, test_user):
-        """Test TweetForm with valid data"""
-        form_data = {"text": "This is a valid tweet"}
-        form = TweetForm(data=form_data)
+    assert form.is_valid()
+    assert form.cleaned_data["text"] == "This is valid text"
 
-        assert form.is_valid()
-        assert form.cleaned_data["text"] == "This is a valid tweet"
 
-    def test_tweet_form_empty_text(self, test_user):
-        """Test TweetForm with empty text"""
-        form_data = {"text": ""}
-        form = TweetForm(data=form_data)
+@pytest.mark.django_db
+@pytest.mark.forms
+@pytest.mark.unit
+@_FORM_CLASSES
+@pytest.mark.parametrize(
+    "text,expected_valid",
+    [("", False), ("x", True), ("x" * 280, True), ("x" * 281, False)],
+    ids=["empty", "one", "max", "over_max"],
+)
+def test_form_text_validation(form_cls, text, expected_valid):
+    """Test form text validation at the length boundaries"""
+    form = form_cls(data={"text": text})
 
-        assert not form.is_valid()
-        assert "text" in form.errors
+    assert form.is_valid() is expected_valid
+    assert ("text" in form.errors) is not expected_valid
 
-    def test_tweet_form_fields(self, test_user):
-        """Test TweetForm field configuration"""
-        form = TweetForm()
 
-        assert "text" in form.fields
-        assert "image" in form.fields
-        assert form.Meta.fields == ["text", "image"]
+@pytest.mark.forms
+@pytest.mark.unit
+@_FORM_CLASSES
+def test_form_fields(form_cls, unbound_forms):
+    """Test form field configuration"""
+    form = unbound_forms[form_cls]
 
-    def test_tweet_form_save(self, test_user):
-        """Test TweetForm save method"""
-        form_data = {"text": "Test tweet to save"}
-        form = TweetForm(data=form_data)
+    assert "text" in form.fields
+    assert "image" in form.fields
+    assert form.Meta.fields == ["text", "image"]
 
-        if form.is_valid():
-            tweet = form.save(commit=False)
-            tweet.user = test_user
-            tweet.save()
 
-            assert tweet.text == "Test tweet to save"
-            assert tweet.user == test_user
+@pytest.mark.forms
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "form_cls,rows,placeholder",
+    [
+        (TweetForm, 3, "What's happening? (max 280 characters)"),
+        (ReplyForm, 2, "Reply to this tweet..."),
+    ],
+    ids=["tweet", "reply"],
+)
+def test_form_widget_attributes(form_cls, rows, placeholder, unbound_forms):
+    """Test text and image widget attributes"""
+    form = unbound_forms[form_cls]
+    text_attrs = form.fields["text"].widget.attrs
+    image_attrs = form.fields["image"].widget.attrs
+
+    assert text_attrs["class"] == "form-control"
+    assert text_attrs["rows"] == rows
+    assert text_attrs["placeholder"] == placeholder
+    assert str(text_attrs["maxlength"]) == "280"
+    assert image_attrs["class"] == "form-control"
+    assert image_attrs["accept"] == "image/*"
 
 
 @pytest.mark.django_db
 @pytest.mark.forms
 @pytest.mark.unit
-class TestReplyForm:
-    """Test cases for ReplyForm"""
+@_FORM_CLASSES
+def test_form_save(form_cls, test_user):
+    """Test form save method"""
+    form = form_cls(data={"text": "Text to save"})
 
-    def test_reply_form_valid_data(self, test_user):
-        """Test ReplyForm with valid data"""
-        form_data = {"text": "This is a valid reply"}
-        form = ReplyForm(data=form_data)
+    assert form.is_valid()
+    tweet = form.save(commit=False)
+    tweet.user = test_user
+    tweet.save()
 
-        assert form.is_valid()
-        assert form.cleaned_data["text"] == "This is a valid reply"
+    assert tweet.text == "Text to save"
+    assert tweet.user == test_user
 
-    def test_reply_form_empty_text(self, test_user):
-        """Test ReplyForm with empty text"""
-        form_data = {"text": ""}
-        form = ReplyForm(data=form_data)
 
-        assert not form.is_valid()
-        assert "text" in form.errors
-
-    def test_reply_form_fields(self, test_user):
-        """Test ReplyForm field configuration"""
-        form = ReplyForm()
-
-        assert "text" in form.fields
-        assert "image" in form.fields
-        assert form.Meta.fields == ["text", "image"]
+@pytest.mark.django_db
+@pytest.mark.forms
+@pytest.mark.unit
+@pytest.mark.upload
+@_FORM_CLASSES
+@pytest.mark.parametrize(
+    "size,expected_valid", [(5 * 1024 * 1024, True), (5 * 1024 * 1024 + 1, False)]
+)
+def test_image_size_validation_edge_case(form_cls, size, expected_valid):
+    """Test that images of exactly 5MB pass and anything larger fails"""
+    form = form_cls(
+        data={"text": "Edge case"},
+        files={"image": _sized_upload("exact_size.jpg", size)},
+    )
 
-    def test_reply_form_save(self, test_user):
-        """Test ReplyForm save method"""
-        form_data = {"text": "Test reply to save"}
-        form = ReplyForm(data=form_data)
+    assert form.is_valid() is expected_valid
 
-        if form.is_valid():
-            reply = form.save(commit=False)
-            reply.user = test_user
-            reply.save()
 
-            assert reply.text == "Test reply to save"
-            assert reply.user == test_user
+@pytest.mark.django_db
+@pytest.mark.forms
+@pytest.mark.unit
+@pytest.mark.upload
+@_FORM_CLASSES
+def test_image_content_type_validation(form_cls):
+    """Test which image content types the forms accept"""
+    for filename, content_type, expected_valid in _IMAGE_TYPE_CASES:
+        image = SimpleUploadedFile(filename, b"x", content_type=content_type)
+        form = form_cls(data={"text": "Tweet with image"}, files={"image": image})
+
+        # The message is only built when the assertion fails
+        assert form.is_valid() is expected_valid, f"{filename} ({content_type})"
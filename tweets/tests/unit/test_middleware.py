@@ -0,0 +1,72 @@
+"""
+Unit tests for the upload size middleware using pytest
+"""
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from tweets.middleware.file_size import file_size_middleware
+
+_factory = RequestFactory()
+# Deliberately not the production limit, so the tests prove the setting is read
+_MAX_SIZE = 1024 * 1024
+
+
+@pytest.fixture
+def middleware(settings):
+    """file_size_middleware, limited to _MAX_SIZE, around a view that answers 200"""
+    settings.MAX_UPLOAD_SIZE = _MAX_SIZE
+    return file_size_middleware(lambda request: HttpResponse("ok"))
+
+
+@pytest.mark.unit
+class TestFileSizeMiddleware:
+    """Test cases for file_size_middleware"""
+
+    @pytest.mark.parametrize(
+        "content_length,expected_status", [(_MAX_SIZE, 200), (_MAX_SIZE + 1, 413)]
+    )
+    def test_multipart_size_limit(self, middleware, content_length, expected_status):
+        """Test that only multipart bodies over MAX_UPLOAD_SIZE are rejected"""
+        request = _factory.post(
+            "/", {"text": "Tweet"}, CONTENT_LENGTH=str(content_length)
+        )
+
+        response = middleware(request)
+
+        assert response.status_code == expected_status
+
+    def test_oversized_json_request_gets_json_error(self, middleware):
+        """Test that clients accepting JSON get a JSON error body"""
+        request = _factory.post(
+            "/",
+            {"text": "Tweet"},
+            CONTENT_LENGTH=str(_MAX_SIZE + 1),
+            HTTP_ACCEPT="application/json",
+        )
+
+        response = middleware(request)
+
+        assert response.status_code == 413
+        assert response["Content-Type"] == "application/json"
+
+    def test_non_multipart_request_passes_through(self, middleware):
+        """Test that non-multipart bodies are left to Django's own limits"""
+        request = _factory.post(
+            "/",
+            "text=Tweet",
+            content_type="application/x-www-form-urlencoded",
+            CONTENT_LENGTH=str(_MAX_SIZE + 1),
+        )
+
+        response = middleware(request)
+
+        assert response.status_code == 200
+
+    def test_malformed_content_length_passes_through(self, middleware):
+        """Test that a malformed Content-Length is treated as 0 instead of a 500"""
+        request = _factory.post("/", {"text": "Tweet"}, CONTENT_LENGTH="abc")
+
+        response = middleware(request)
+
+        assert response.status_code == 200
@@ -2,11 +2,39 @@
 Unit tests for Tweet views using pytest
 """
 
+from datetime import timedelta
 import pytest
 from django.test import RequestFactory
-from django.contrib.messages.storage.fallback import FallbackStorage
+from django.utils import timezone
 from django.contrib.auth.models import User
 from tweets.models import Tweet
+from tweets.views import (
+    TWEETS_PER_PAGE,
+    tweet_create,
+    tweet_delete,
+    tweet_detail,
+    tweet_list,
+    tweet_update,
+)
+
+_factory = RequestFactory()
+
+
+@pytest.fixture
+def make_request(monkeypatch):
+    """Build a request with a user; messages sent by the view are discarded"""
+    # Requests without _messages already read as having no messages, so only
+    # adding them needs to be silenced
+    monkeypatch.setattr(
+        "django.contrib.messages.api.add_message", lambda *args, **kwargs: None
+    )
+
+    def _make_request(method, path, data=None, user=None):
+        request = getattr(_factory, method)(path, data or {})
+        request.user = user
+        return request
+
+    return _make_request
 
 
 @pytest.mark.django_db
@@ -15,34 +43,62 @@ from tweets.models import Tweet
 class TestTweetListView:
     """Test cases for tweet_list view"""
 
-    def test_tweet_list_get_basic(self, test_user):
+    def test_tweet_list_get_basic(self, make_request, test_user):
         """Test basic GET request to tweet_list view"""
         # Create some test tweets
-        tweet1 = Tweet.objects.create(text="First tweet", user=test_user)
-        tweet2 = Tweet.objects.create(text="Second tweet", user=test_user)
-
-        factory = RequestFactory()
-        request = factory.get("/")
-        request.user = test_user
+        Tweet.objects.bulk_create(
+            [
+                Tweet(text="First tweet", user=test_user),
+                Tweet(text="Second tweet", user=test_user),
+            ]
+        )
 
-        from tweets.views import tweet_list
+        request = make_request("get", "/", user=test_user)
 
         response = tweet_list(request)
 
         assert response.status_code == 200
 
-    def test_tweet_list_post_basic(self, test_user):
+    def test_tweet_list_paginates(self, make_request, test_user):
+        """Test that tweet_list renders at most one page of tweets"""
+        Tweet.objects.bulk_create(
+            [
+                Tweet(text=f"Tweet {i}", user=test_user)
+                for i in range(TWEETS_PER_PAGE + 1)
+            ]
+        )
+
+        first = tweet_list(make_request("get", "/", user=test_user))
+        second = tweet_list(make_request("get", "/", {"page": 2}, user=test_user))
+
+        assert first.content.count(b'<div class="tweet">') == TWEETS_PER_PAGE
+        assert second.content.count(b'<div class="tweet">') == 1
+
+    def test_tweet_list_caches_feed(
+        self, make_request, test_user, settings, django_assert_num_queries
+    ):
+        """Test that a repeat GET reuses the cached feed until a tweet changes"""
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-tweet-feed",
+            }
+        }
+        Tweet.objects.create(text="Cached tweet", user=test_user)
+        tweet_list(make_request("get", "/", user=test_user))
+
+        # Only the paginator's COUNT runs; the page itself comes from the cache
+        with django_assert_num_queries(1):
+            response = tweet_list(make_request("get", "/", user=test_user))
+        assert b"Cached tweet" in response.content
+
+        Tweet.objects.create(text="Fresh tweet", user=test_user)
+        response = tweet_list(make_request("get", "/", user=test_user))
+        assert b"Fresh tweet" in response.content
+
+    def test_tweet_list_post_basic(self, make_request, test_user):
         """Test basic POST request to tweet_list view"""
-        factory = RequestFactory()
-        request = factory.post("/", {"text": "Test tweet"})
-        request.user = test_user
-
-        # Add messages framework
-        setattr(request, "session", {})
-        messages = FallbackStorage(request)
-        setattr(request, "_messages", messages)
-
-        from tweets.views import tweet_list
+        request = make_request("post", "/", {"text": "Test tweet"}, user=test_user)
 
         response = tweet_list(request)
 
@@ -56,30 +112,19 @@ class TestTweetListView:
 class TestTweetCreateView:
     """Test cases for tweet_create view"""
 
-    def test_tweet_create_get_basic(self, test_user):
+    def test_tweet_create_get_basic(self, make_request, test_user):
         """Test basic GET request to tweet_create view"""
-        factory = RequestFactory()
-        request = factory.get("/create/")
-        request.user = test_user
-
-        from tweets.views import tweet_create
+        request = make_request("get", "/create/", user=test_user)
 
         response = tweet_create(request)
 
         assert response.status_code == 200
 
-    def test_tweet_create_post_basic(self, test_user):
+    def test_tweet_create_post_basic(self, make_request, test_user):
         """Test basic POST request to tweet_create view"""
-        factory = RequestFactory()
-        request = factory.post("/create/", {"text": "Test tweet"})
-        request.user = test_user
-
-        # Add messages framework
-        setattr(request, "session", {})
-        messages = FallbackStorage(request)
-        setattr(request, "_messages", messages)
-
-        from tweets.views import tweet_create
+        request = make_request(
+            "post", "/create/", {"text": "Test tweet"}, user=test_user
+        )
 
         response = tweet_create(request)
 
@@ -93,16 +138,12 @@ class TestTweetCreateView:
 class TestTweetDetailView:
     """Test cases for tweet_detail view"""
 
-    def test_tweet_detail_basic(self, test_user):
+    def test_tweet_detail_basic(self, make_request, test_user):
         """Test basic tweet_detail view"""
         # Create a tweet
         tweet = Tweet.objects.create(text="Test tweet", user=test_user)
 
-        factory = RequestFactory()
-        request = factory.get(f"/{tweet.pk}/")
-        request.user = test_user
-
-        from tweets.views import tweet_detail
+        request = make_request("get", f"/{tweet.pk}/", user=test_user)
 
         response = tweet_detail(request, tweet.pk)
 
@@ -115,20 +156,35 @@ class TestTweetDetailView:
 class TestTweetUpdateView:
     """Test cases for tweet_update view"""
 
-    def test_tweet_update_get_basic(self, test_user):
+    def test_tweet_update_get_basic(self, make_request, test_user):
         """Test basic GET request to tweet_update view"""
         tweet = Tweet.objects.create(text="Original tweet", user=test_user)
 
-        factory = RequestFactory()
-        request = factory.get(f"/{tweet.pk}/update/")
-        request.user = test_user
-
-        from tweets.views import tweet_update
+        request = make_request("get", f"/{tweet.pk}/update/", user=test_user)
 
         response = tweet_update(request, tweet.pk)
 
         assert response.status_code == 200
 
+    def test_tweet_update_post_basic(self, make_request, test_user):
+        """Test basic POST request to tweet_update view"""
+        tweet = Tweet.objects.create(text="Original tweet", user=test_user)
+        stale = timezone.now() - timedelta(days=1)
+        Tweet.objects.filter(pk=tweet.pk).update(updated_at=stale)
+
+        request = make_request(
+            "post", f"/{tweet.pk}/update/", {"text": "Edited tweet"}, user=test_user
+        )
+
+        response = tweet_update(request, tweet.pk)
+
+        # POST with valid data should redirect (302) after a successful update
+        assert response.status_code == 302
+        tweet.refresh_from_db()
+        assert tweet.text == "Edited tweet"
+        # The partial save must still include updated_at
+        assert tweet.updated_at > stale
+
 
 @pytest.mark.django_db
 @pytest.mark.views
@@ -136,16 +192,25 @@ class TestTweetUpdateView:
 class TestTweetDeleteView:
     """Test cases for tweet_delete view"""
 
-    def test_tweet_delete_get_basic(self, test_user):
+    def test_tweet_delete_get_basic(self, make_request, test_user):
         """Test basic GET request to tweet_delete view"""
         tweet = Tweet.objects.create(text="Tweet to delete", user=test_user)
 
-        factory = RequestFactory()
-        request = factory.get(f"/{tweet.pk}/delete/")
-        request.user = test_user
-
-        from tweets.views import tweet_delete
+        request = make_request("get", f"/{tweet.pk}/delete/", user=test_user)
 
         response = tweet_delete(request, tweet.pk)
 
         assert response.status_code == 200
+
+    def test_tweet_delete_post_basic(self, make_request, test_user):
+        """Test basic POST request to tweet_delete view"""
+        tweet = Tweet.objects.create(text="Tweet to delete", user=test_user)
+        Tweet.objects.create(text="Reply", user=test_user, parent_tweet=tweet)
+
+        request = make_request("post", f"/{tweet.pk}/delete/", user=test_user)
+
+        response = tweet_delete(request, tweet.pk)
+
+        # POST should redirect (302) after deleting the tweet and its replies
+        assert response.status_code == 302
+        assert not Tweet.objects.exists()
@@ -1,14 +1,20 @@
-from django.urls import path
+from django.urls import include, path
 from . import views
 
 app_name = "tweets"
 
+# Routes for a single tweet share one "<int:pk>/" prefix so resolution only
+# descends into them when the prefix matches
+tweet_patterns = [
+    path("", views.tweet_detail, name="tweet_detail"),
+    path("update/", views.tweet_update, name="tweet_update"),
+    path("delete/", views.tweet_delete, name="tweet_delete"),
+    path("reply/", views.tweet_reply, name="tweet_reply"),
+]
+
 urlpatterns = [
     # CRUD operations
     path("", views.tweet_list, name="tweet_list"),
     path("create/", views.tweet_create, name="tweet_create"),
-    path("<int:pk>/", views.tweet_detail, name="tweet_detail"),
-    path("<int:pk>/update/", views.tweet_update, name="tweet_update"),
-    path("<int:pk>/delete/", views.tweet_delete, name="tweet_delete"),
-    path("<int:pk>/reply/", views.tweet_reply, name="tweet_reply"),
+    path("<int:pk>/", include(tweet_patterns)),
 ]
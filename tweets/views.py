@@ -1,42 +1,61 @@
 import logging
+from functools import lru_cache
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.contrib.auth.models import User
+from django.core.paginator import Paginator
+from django.http import HttpResponseRedirect
+from django.urls import reverse
 from .models import Tweet
+from .feed_cache import FEED_CACHE_TIMEOUT, feed_cache_version
 from .forms import TweetForm, ReplyForm
 
 logger = logging.getLogger(__name__)
 
+TWEETS_PER_PAGE = 25
+
+
+@lru_cache(maxsize=1)
+def _default_user_id():
+    """ID of the default user (ID 1) that owns anonymous posts, looked up once"""
+    return User.objects.values_list("id", flat=True).get(id=1)
+
+
+@lru_cache(maxsize=1)
+def _tweet_list_url():
+    """URL of the tweet feed, reversed once instead of on every redirect"""
+    return reverse("tweets:tweet_list")
+
+
+def _report_form_errors(request, form, rejection):
+    """Flash the form's image errors, noting the rejection for size errors"""
+    image_errors = form.errors.get("image")
+    if not image_errors:
+        messages.error(request, "Please correct the errors below.")
+        return
+
+    for error in image_errors:
+        error = str(error)
+        if "file size" in error.lower():
+            messages.error(request, f"Image error: {error}. {rejection}")
+        else:
+            messages.error(request, f"Image error: {error}")
+
 
 def tweet_list(request):
     """Display list of all tweets and handle tweet creation"""
-    logger.info(f"tweet_list called with method: {request.method}")
+    logger.info("tweet_list called with method: %s", request.method)
 
     if request.method == "POST":
-        logger.info(f"POST data: {request.POST}")
-        logger.info(f"FILES data: {request.FILES}")
-
-        # Check if request is too large before processing
-        if request.content_type and "multipart/form-data" in request.content_type:
-            content_length = request.META.get("CONTENT_LENGTH", 0)
-            if content_length and int(content_length) > 5 * 1024 * 1024:  # 5MB
-                messages.error(
-                    request,
-                    "File too large! Maximum file size is 5MB. Tweet cannot be published.",
-                )
-                form = TweetForm()
-                tweets = Tweet.objects.filter(parent_tweet__isnull=True).order_by(
-                    "-created_at"
-                )
-                return render(
-                    request, "tweets/list.html", {"tweets": tweets, "form": form}
-                )
+        logger.info("POST data: %s", request.POST)
+        logger.info("FILES data: %s", request.FILES)
 
         form = TweetForm(request.POST, request.FILES)
-        logger.info(f"Form is valid: {form.is_valid()}")
-        logger.info(f"Form data: {form.data}")
-        logger.info(f"Form fields: {form.fields}")
-        logger.info(f"Form errors: {form.errors}")
+        logger.info("Form is valid: %s", form.is_valid())
+        logger.info("Form data: %s", form.data)
+        logger.info("Form fields: %s", form.fields)
+        logger.info("Form errors: %s", form.errors)
 
         if form.is_valid():
             logger.info("Form is valid, creating tweet...")
@@ -45,56 +64,46 @@ def tweet_list(request):
             # Use default user (ID 1) if not authenticated
             if request.user.is_authenticated:
                 tweet.user = request.user
-                logger.info(f"Using authenticated user: {request.user.username}")
+                logger.info("Using authenticated user: %s", request.user.username)
             else:
-                from django.contrib.auth.models import User
-
-                tweet.user = User.objects.get(id=1)
-                logger.info(f"Using default user: {tweet.user.username}")
+                tweet.user_id = _default_user_id()
+                logger.info("Using default user ID: %s", tweet.user_id)
 
             tweet.save()
-            logger.info(f"Tweet saved successfully with ID: {tweet.id}")
+            logger.info("Tweet saved successfully with ID: %s", tweet.id)
             messages.success(request, "Tweet posted successfully!")
-            return redirect("tweets:tweet_list")
+            return HttpResponseRedirect(_tweet_list_url())
         else:
-            logger.error(f"Form errors: {form.errors}")
-            # Check for specific file size errors
-            if "image" in form.errors:
-                for error in form.errors["image"]:
-                    if "file size" in str(error).lower():
-                        messages.error(
-                            request,
-                            f"Image error: {error}. Tweet cannot be published.",
-                        )
-                    else:
-                        messages.error(request, f"Image error: {error}")
-            else:
-                messages.error(request, "Please correct the errors below.")
+            logger.error("Form errors: %s", form.errors)
+            _report_form_errors(request, form, "Tweet cannot be published.")
     else:
         form = TweetForm()
 
-    tweets = Tweet.objects.filter(parent_tweet__isnull=True).order_by("-created_at")
-    logger.info(f"Found {tweets.count()} tweets")
-    logger.info(f"Form bound: {form.is_bound}")
-    logger.info(f"Form initial: {form.initial}")
+    tweets = (
+        Tweet.objects.only_displayed()
+        .filter(parent_tweet__isnull=True)
+        .order_by("-created_at")
+    )
+    page_obj = Paginator(tweets, TWEETS_PER_PAGE).get_page(request.GET.get("page"))
+    logger.info("Form bound: %s", form.is_bound)
+    logger.info("Form initial: %s", form.initial)
 
-    return render(request, "tweets/list.html", {"tweets": tweets, "form": form})
+    return render(
+        request,
+        "tweets/list.html",
+        {
+            "tweets": page_obj,
+            "page_obj": page_obj,
+            "form": form,
+            "feed_cache_timeout": FEED_CACHE_TIMEOUT,
+            "feed_version": feed_cache_version(),
+        },
+    )
 
 
 def tweet_create(request):
     """Create a new tweet"""
     if request.method == "POST":
-        # Check if request is too large before processing
-        if request.content_type and "multipart/form-data" in request.content_type:
-            content_length = request.META.get("CONTENT_LENGTH", 0)
-            if content_length and int(content_length) > 5 * 1024 * 1024:  # 5MB
-                messages.error(
-                    request,
-                    "File too large! Maximum file size is 5MB. Tweet cannot be published.",
-                )
-                form = TweetForm()
-                return render(request, "tweets/create.html", {"form": form})
-
         form = TweetForm(request.POST, request.FILES)
         if form.is_valid():
             tweet = form.save(commit=False)
@@ -102,26 +111,13 @@ def tweet_create(request):
             if request.user.is_authenticated:
                 tweet.user = request.user
             else:
-                from django.contrib.auth.models import User
-
-                tweet.user = User.objects.get(id=1)
+                tweet.user_id = _default_user_id()
 
             tweet.save()
             messages.success(request, "Tweet posted successfully!")
-            return redirect("tweets:tweet_list")
+            return HttpResponseRedirect(_tweet_list_url())
         else:
-            # Check for specific file size errors
-            if "image" in form.errors:
-                for error in form.errors["image"]:
-                    if "file size" in str(error).lower():
-                        messages.error(
-                            request,
-                            f"Image error: {error}. Tweet cannot be published.",
-                        )
-                    else:
-                        messages.error(request, f"Image error: {error}")
-            else:
-                messages.error(request, "Please correct the errors below.")
+            _report_form_errors(request, form, "Tweet cannot be published.")
     else:
         form = TweetForm()
 
@@ -130,8 +126,9 @@ def tweet_create(request):
 
 def tweet_detail(request, pk):
     """Display tweet detail with replies"""
-    tweet = get_object_or_404(Tweet, pk=pk)
-    replies = tweet.replies.all().order_by("created_at")
+    tweet = get_object_or_404(Tweet.objects.select_related("user"), pk=pk)
+    # parent_tweet stays loaded so the manager can attach the parent without queries
+    replies = tweet.replies.only_displayed("parent_tweet").order_by("created_at")
     reply_form = ReplyForm()
 
     return render(
@@ -144,25 +141,15 @@ def tweet_detail(request, pk):
 def tweet_reply(request, pk):
     """Reply to a tweet"""
     parent_tweet = get_object_or_404(Tweet, pk=pk)
-    logger.info(f"tweet_reply called for tweet {pk} with method: {request.method}")
+    logger.info("tweet_reply called for tweet %s with method: %s", pk, request.method)
 
     if request.method == "POST":
-        logger.info(f"POST data: {request.POST}")
-        logger.info(f"FILES data: {request.FILES}")
-
-        # Check if request is too large before processing
-        if request.content_type and "multipart/form-data" in request.content_type:
-            content_length = request.META.get("CONTENT_LENGTH", 0)
-            if content_length and int(content_length) > 5 * 1024 * 1024:  # 5MB
-                messages.error(
-                    request,
-                    "File too large! Maximum file size is 5MB. Reply cannot be published.",
-                )
-                return redirect("tweets:tweet_detail", pk=pk)
+        logger.info("POST data: %s", request.POST)
+        logger.info("FILES data: %s", request.FILES)
 
         form = ReplyForm(request.POST, request.FILES)
-        logger.info(f"Form is valid: {form.is_valid()}")
-        logger.info(f"Form errors: {form.errors}")
+        logger.info("Form is valid: %s", form.is_valid())
+        logger.info("Form errors: %s", form.errors)
 
         if form.is_valid():
             reply = form.save(commit=False)
@@ -170,28 +157,15 @@ def tweet_reply(request, pk):
             if request.user.is_authenticated:
                 reply.user = request.user
             else:
-                from django.contrib.auth.models import User
-
-                reply.user = User.objects.get(id=1)
+                reply.user_id = _default_user_id()
 
             reply.parent_tweet = parent_tweet
             reply.save()
-            logger.info(f"Reply saved successfully with ID: {reply.id}")
+            logger.info("Reply saved successfully with ID: %s", reply.id)
             messages.success(request, "Reply posted successfully!")
             return redirect("tweets:tweet_detail", pk=pk)
         else:
-            # Check for specific file size errors
-            if "image" in form.errors:
-                for error in form.errors["image"]:
-                    if "file size" in str(error).lower():
-                        messages.error(
-                            request,
-                            f"Image error: {error}. Reply cannot be published.",
-                        )
-                    else:
-                        messages.error(request, f"Image error: {error}")
-            else:
-                messages.error(request, "Please correct the errors below.")
+            _report_form_errors(request, form, "Reply cannot be published.")
 
     return redirect("tweets:tweet_detail", pk=pk)
 
@@ -202,37 +176,16 @@ def tweet_update(request, pk):
     tweet = get_object_or_404(Tweet, pk=pk, user=request.user)
 
     if request.method == "POST":
-        # Check if request is too large before processing
-        if request.content_type and "multipart/form-data" in request.content_type:
-            content_length = request.META.get("CONTENT_LENGTH", 0)
-            if content_length and int(content_length) > 5 * 1024 * 1024:  # 5MB
-                messages.error(
-                    request,
-                    "File too large! Maximum file size is 5MB. Tweet cannot be updated.",
-                )
-                form = TweetForm(instance=tweet)
-                return render(
-                    request, "tweets/update.html", {"form": form, "tweet": tweet}
-                )
-
         form = TweetForm(request.POST, request.FILES, instance=tweet)
         if form.is_valid():
-            form.save()
+            # Only write the columns the user actually edited
+            form.save(commit=False).save(
+                update_fields=[*form.changed_data, "updated_at"]
+            )
             messages.success(request, "Tweet updated successfully!")
             return redirect("tweets:tweet_detail", pk=pk)
         else:
-            # Check for specific file size errors
-            if "image" in form.errors:
-                for error in form.errors["image"]:
-                    if "file size" in str(error).lower():
-                        messages.error(
-                            request,
-                            f"Image error: {error}. Tweet cannot be updated.",
-                        )
-                    else:
-                        messages.error(request, f"Image error: {error}")
-            else:
-                messages.error(request, "Please correct the errors below.")
+            _report_form_errors(request, form, "Tweet cannot be updated.")
     else:
         form = TweetForm(instance=tweet)
 
@@ -242,11 +195,12 @@ def tweet_update(request, pk):
 @login_required
 def tweet_delete(request, pk):
     """Delete tweet"""
-    tweet = get_object_or_404(Tweet, pk=pk, user=request.user)
-
     if request.method == "POST":
+        # The ownership check and the cascade to replies only need the pk
+        tweet = get_object_or_404(Tweet.objects.only("id"), pk=pk, user=request.user)
         tweet.delete()
         messages.success(request, "Tweet deleted successfully!")
-        return redirect("tweets:tweet_list")
+        return HttpResponseRedirect(_tweet_list_url())
 
+    tweet = get_object_or_404(Tweet.objects.only_displayed(), pk=pk, user=request.user)
     return render(request, "tweets/delete.html", {"tweet": tweet})